@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-from PyPDF2 import PdfReader, PdfWriter
-import os
+from array import array
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,176 +14,202 @@ class Command(ABC):
     def undo(self):
         pass
 
-class RotatePagesCommand(Command):
-    """Command for rotating pages"""
-    def __init__(self, pdf_ops, page_numbers, degrees):
+class _BasePdfCommand(Command):
+    """Shared execute/undo plumbing for commands that edit the page list in place"""
+    action = "page"
+    
+    def __init__(self, pdf_ops):
         self.pdf_ops = pdf_ops
-        self.page_numbers = page_numbers
-        self.degrees = degrees
-        self.original_pdf_path = None
-        self.temp_file = "temp_rotated.pdf"
+        self.executed = False
+    
+    @abstractmethod
+    def _apply(self, page_refs, previews):
+        """Edit the page references and previews in place, recording what undo needs"""
+        pass
+    
+    @abstractmethod
+    def _revert(self, page_refs, previews):
+        """Invert the edit recorded by _apply"""
+        pass
+    
+    def _is_noop(self):
+        """Whether the command would leave the document unchanged"""
+        return False
+    
+    def _edit_lists(self):
+        page_refs = self.pdf_ops.get_page_refs()
+        previews = self.pdf_ops.preview_images
+        # Only keep previews in step with the pages when they line up one to one
+        if len(previews) != len(page_refs):
+            previews = []
+        return page_refs, previews
     
     def execute(self):
         try:
-            # Save current state
-            self.original_pdf_path = self.pdf_ops.current_path
-            writer = PdfWriter()
-            
-            # Process all pages
-            for i in range(self.pdf_ops.get_total_pages()):
-                page = self.pdf_ops.get_page(i)
-                if page:
-                    if i in self.page_numbers:
-                        page.rotate(self.degrees)
-                    writer.add_page(page)
-            
-            # Save to temporary file
-            with open(self.temp_file, 'wb') as output_file:
-                writer.write(output_file)
-            
-            # Reload the PDF
-            self.pdf_ops.load_pdf(self.temp_file)
+            if self._is_noop():
+                # Nothing to edit, so skip the writer, the refresh and the modified flag
+                self.executed = True
+                return True
+            # Edit the in-memory document; nothing is written until the user saves
+            self._apply(*self._edit_lists())
+            self.pdf_ops.pages_changed()
+            self.executed = True
             return True
         except Exception as e:
-            logger.error(f"Error executing rotate command: {str(e)}")
+            logger.error(f"Error executing {self.action} command: {str(e)}")
             return False
     
     def undo(self):
         try:
-            if self.original_pdf_path:
-                self.pdf_ops.load_pdf(self.original_pdf_path)
-                if os.path.exists(self.temp_file):
-                    os.remove(self.temp_file)
+            if self.executed:
+                if not self._is_noop():
+                    self._revert(*self._edit_lists())
+                    self.pdf_ops.pages_changed()
+                self.executed = False
                 return True
         except Exception as e:
-            logger.error(f"Error undoing rotate command: {str(e)}")
+            logger.error(f"Error undoing {self.action} command: {str(e)}")
         return False
 
-class DuplicatePagesCommand(Command):
+class RotatePagesCommand(_BasePdfCommand):
+    """Command for rotating pages"""
+    action = "rotate"
+    
+    def __init__(self, pdf_ops, page_numbers, degrees):
+        super().__init__(pdf_ops)
+        self.page_numbers = frozenset(page_numbers)
+        self.degrees = degrees
+    
+    def _is_noop(self):
+        return self.degrees % 360 == 0
+    
+    def _rotate(self, page_refs, previews, degrees):
+        from pypdf.generic import NameObject, NumberObject
+        # Update /Rotate directly rather than going through PageObject.rotate per page
+        rotate_key = NameObject("/Rotate")
+        degrees %= 360
+        # Bind loop invariants to locals once instead of looking them up per page
+        page_count = len(page_refs)
+        number = NumberObject
+        for i in self.page_numbers:
+            if 0 <= i < page_count:
+                page = page_refs[i].get_object()
+                # Indexing resolves an indirect /Rotate value, dict.get would not
+                current = page[rotate_key] if rotate_key in page else 0
+                page[rotate_key] = number((int(current) + degrees) % 360)
+                if previews:
+                    # PIL rotates counter-clockwise, PDF /Rotate is clockwise
+                    previews[i] = previews[i].rotate(-degrees, expand=True)
+    
+    def _apply(self, page_refs, previews):
+        self._rotate(page_refs, previews, self.degrees)
+    
+    def _revert(self, page_refs, previews):
+        self._rotate(page_refs, previews, -self.degrees)
+
+class DuplicatePagesCommand(_BasePdfCommand):
     """Command for duplicating pages"""
+    action = "duplicate"
+    
     def __init__(self, pdf_ops, page_numbers):
-        self.pdf_ops = pdf_ops
-        self.page_numbers = page_numbers
-        self.original_pdf_path = None
-        self.temp_file = "temp_duplicated.pdf"
+        super().__init__(pdf_ops)
+        self.page_numbers = frozenset(page_numbers)
+        self.copied = []
     
-    def execute(self):
-        try:
-            # Save current state
-            self.original_pdf_path = self.pdf_ops.current_path
-            writer = PdfWriter()
-            
-            # Process all pages
-            for i in range(self.pdf_ops.get_total_pages()):
-                page = self.pdf_ops.get_page(i)
-                if page:
-                    writer.add_page(page)
-                    if i in self.page_numbers:
-                        writer.add_page(page)
-            
-            # Save to temporary file
-            with open(self.temp_file, 'wb') as output_file:
-                writer.write(output_file)
-            
-            # Reload the PDF
-            self.pdf_ops.load_pdf(self.temp_file)
-            return True
-        except Exception as e:
-            logger.error(f"Error executing duplicate command: {str(e)}")
-            return False
+    def _apply(self, page_refs, previews):
+        page_count = len(page_refs)
+        self.copied = sorted(i for i in self.page_numbers if 0 <= i < page_count)
+        copy_page = self.pdf_ops.copy_page
+        # Insert from the back so the remaining indices stay valid
+        for i in reversed(self.copied):
+            page_refs.insert(i + 1, copy_page(page_refs[i]))
+            if previews:
+                previews.insert(i + 1, previews[i])
     
-    def undo(self):
-        try:
-            if self.original_pdf_path:
-                self.pdf_ops.load_pdf(self.original_pdf_path)
-                if os.path.exists(self.temp_file):
-                    os.remove(self.temp_file)
-                return True
-        except Exception as e:
-            logger.error(f"Error undoing duplicate command: {str(e)}")
-        return False
+    def _revert(self, page_refs, previews):
+        # The copy of the k-th duplicated page ended up at index i + k + 1
+        for k in reversed(range(len(self.copied))):
+            index = self.copied[k] + k + 1
+            del page_refs[index]
+            if previews:
+                del previews[index]
 
-class RemovePagesCommand(Command):
+class RemovePagesCommand(_BasePdfCommand):
     """Command for removing pages"""
+    action = "remove"
+    
     def __init__(self, pdf_ops, page_numbers):
-        self.pdf_ops = pdf_ops
-        self.page_numbers = page_numbers
-        self.original_pdf_path = None
-        self.temp_file = "temp_removed.pdf"
+        super().__init__(pdf_ops)
+        self.page_numbers = frozenset(page_numbers)
+        self.removed = []
     
-    def execute(self):
-        try:
-            # Save current state
-            self.original_pdf_path = self.pdf_ops.current_path
-            writer = PdfWriter()
-            
-            # Add all pages except the ones to be removed
-            for i in range(self.pdf_ops.get_total_pages()):
-                if i not in self.page_numbers:
-                    page = self.pdf_ops.get_page(i)
-                    if page:
-                        writer.add_page(page)
-            
-            # Save to temporary file
-            with open(self.temp_file, 'wb') as output_file:
-                writer.write(output_file)
-            
-            # Reload the PDF
-            self.pdf_ops.load_pdf(self.temp_file)
-            return True
-        except Exception as e:
-            logger.error(f"Error executing remove command: {str(e)}")
-            return False
+    def _apply(self, page_refs, previews):
+        # Remember each removed page and where it was so undo can put it back
+        page_count = len(page_refs)
+        removed = self.removed = []
+        for i in sorted((i for i in self.page_numbers if 0 <= i < page_count), reverse=True):
+            preview = previews.pop(i) if previews else None
+            removed.append((i, page_refs.pop(i), preview))
     
-    def undo(self):
-        try:
-            if self.original_pdf_path:
-                self.pdf_ops.load_pdf(self.original_pdf_path)
-                if os.path.exists(self.temp_file):
-                    os.remove(self.temp_file)
-                return True
-        except Exception as e:
-            logger.error(f"Error undoing remove command: {str(e)}")
-        return False
+    def _revert(self, page_refs, previews):
+        for i, page_ref, preview in reversed(self.removed):
+            page_refs.insert(i, page_ref)
+            if preview is not None:
+                previews.insert(i, preview)
 
-class ReorderPagesCommand(Command):
+class ReorderPagesCommand(_BasePdfCommand):
     """Command for reordering pages"""
+    action = "reorder"
+    
     def __init__(self, pdf_ops, new_order):
-        self.pdf_ops = pdf_ops
-        self.new_order = new_order
-        self.original_pdf_path = None
-        self.temp_file = "temp_reordered.pdf"
+        super().__init__(pdf_ops)
+        # Compact int arrays rather than lists of boxed ints, for large documents
+        self.new_order = array('i', new_order)
+        self.inverse_order = None  # Built once the order is known to be a permutation
     
-    def execute(self):
-        try:
-            # Save current state
-            self.original_pdf_path = self.pdf_ops.current_path
-            writer = PdfWriter()
-            
-            # Add pages in the new order
-            for page_num in self.new_order:
-                page = self.pdf_ops.get_page(page_num)
-                if page:
-                    writer.add_page(page)
-            
-            # Save to temporary file
-            with open(self.temp_file, 'wb') as output_file:
-                writer.write(output_file)
-            
-            # Reload the PDF
-            self.pdf_ops.load_pdf(self.temp_file)
-            return True
-        except Exception as e:
-            logger.error(f"Error executing reorder command: {str(e)}")
-            return False
+    def _is_noop(self):
+        # Dropping pages back where they were leaves the order unchanged
+        return self.new_order == array('i', range(self.pdf_ops.get_total_pages()))
     
-    def undo(self):
+    def _apply(self, page_refs, previews):
+        if sorted(self.new_order) != list(range(len(page_refs))):
+            raise ValueError("New order must contain every page exactly once")
+        if self.inverse_order is None:
+            # Page new_order[k] moves to position k, so it moves back from there on undo
+            self.inverse_order = array('i', [0]) * len(self.new_order)
+            for position, page_num in enumerate(self.new_order):
+                self.inverse_order[page_num] = position
+        self._permute(page_refs, previews, self.new_order)
+    
+    def _revert(self, page_refs, previews):
+        self._permute(page_refs, previews, self.inverse_order)
+    
+    def _permute(self, page_refs, previews, order):
+        page_refs[:] = [page_refs[i] for i in order]
+        if previews:
+            previews[:] = [previews[i] for i in order]
+
+class CommandBatch(_BasePdfCommand):
+    """Apply several page commands as a single edit with one refresh and one undo step"""
+    action = "batch"
+    
+    def __init__(self, pdf_ops, commands):
+        super().__init__(pdf_ops)
+        self.commands = list(commands)
+    
+    def _apply(self, page_refs, previews):
+        applied = []
         try:
-            if self.original_pdf_path:
-                self.pdf_ops.load_pdf(self.original_pdf_path)
-                if os.path.exists(self.temp_file):
-                    os.remove(self.temp_file)
-                return True
-        except Exception as e:
-            logger.error(f"Error undoing reorder command: {str(e)}")
-        return False 
\ No newline at end of file
+            # Each command sees the page list as left by the one before it
+            for command in self.commands:
+                command._apply(page_refs, previews)
+                applied.append(command)
+        except Exception:
+            # Leave the document as it was if any command in the batch fails
+            for command in reversed(applied):
+                command._revert(page_refs, previews)
+            raise
+    
+    def _revert(self, page_refs, previews):
+        for command in reversed(self.commands):
+            command._revert(page_refs, previews)
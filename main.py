@@ -8,18 +8,23 @@ from PyQt6.QtWidgets import (
     QSplitter, QToolBar, QMenu, QDialog, QInputDialog,
     QFontComboBox, QColorDialog, QLineEdit, QCheckBox
 )
-from PyQt6.QtCore import Qt, QSize, QMimeData, QPoint, QThread, pyqtSignal
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QAction, QImage, QPixmap, QDrag, QIcon, QPainter, QPen, QFont, QColor, QMovie
-from pdf_operations import PDFOperations
+from PyQt6.QtCore import Qt, QSize, QMimeData, QPoint, QRect, QThread, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QAction, QImage, QPixmap, QDrag, QIcon, QPainter, QPen, QFont, QColor, QMovie, QStaticText, QTransform, QPixmapCache
+from pdf_operations import PDFOperations, WRITE_BUFFER_SIZE, PREVIEW_CACHE_DIR
 import logging
 import traceback
 from PIL import Image
-from PyPDF2 import PdfWriter
-import fitz  # PyMuPDF
-import easyocr
 import numpy as np
 import json
-from pdf2image import convert_from_path
+import hashlib
+import itertools
+import weakref
+from collections import OrderedDict
+try:
+    # Optional SIMD resizer; Pillow is used when it is not installed
+    from cykooz_resizer import Resizer, ResizeOptions, ResizeAlg, FilterType
+except ImportError:
+    Resizer = None
 from commands import (
     RotatePagesCommand,
     DuplicatePagesCommand,
@@ -31,6 +36,56 @@ from commands import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Memory budget for each pixmap cache; least recently used pixmaps are dropped beyond it
+PIXMAP_CACHE_BYTES = 128 * 1024 * 1024
+
+# Resampling filter for arrange-tab thumbnails; Lanczos is kept for the page viewers
+THUMBNAIL_RESAMPLE = Image.Resampling.BICUBIC
+# Largest page dimension passed to EasyOCR (a Letter page at 150 DPI is 1650 pixels tall)
+OCR_MAX_SIZE = 2000
+
+# Toolbar icons, loaded once per process
+ICONS = {}
+
+def get_icon(name):
+    """Return the QIcon for icons/<name>.png, loading it on first use"""
+    icon = ICONS.get(name)
+    if icon is None:
+        icon = ICONS[name] = QIcon(f"icons/{name}.png")
+    return icon
+
+class PixmapCache:
+    """Least recently used cache of QPixmaps bounded by their total size"""
+    def __init__(self, max_bytes=PIXMAP_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.pixmaps = OrderedDict()
+    
+    @staticmethod
+    def _size(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    
+    def get(self, key):
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+    
+    def put(self, key, pixmap):
+        old = self.pixmaps.pop(key, None)
+        if old is not None:
+            self.total_bytes -= self._size(old)
+        self.pixmaps[key] = pixmap
+        self.total_bytes += self._size(pixmap)
+        # Always keep the newest pixmap, even if it alone is over budget
+        while self.total_bytes > self.max_bytes and len(self.pixmaps) > 1:
+            _, old = self.pixmaps.popitem(last=False)
+            self.total_bytes -= self._size(old)
+    
+    def clear(self):
+        self.pixmaps.clear()
+        self.total_bytes = 0
+
 class PDFPreviewLabel(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -40,10 +95,26 @@ class PDFPreviewLabel(QLabel):
         self.setText("No PDF loaded")
         self.setScaledContents(False)
         self.original_pixmap = None
+        self.scaled_pixmaps = PixmapCache()
+        self.last_render_key = None
         self.zoom_factor = 1.0
         self.min_zoom = 0.25
         self.max_zoom = 4.0
         
+        # Wheel notches arriving in quick succession are applied as one zoom step
+        self.pending_zoom = None
+        self.zoom_timer = QTimer(self)
+        self.zoom_timer.setSingleShot(True)
+        self.zoom_timer.setInterval(16)
+        self.zoom_timer.timeout.connect(self.applyPendingZoom)
+        
+        # While the wheel is zooming, pages are scaled fast and redone smoothly once it settles
+        self.interacting = False
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(150)
+        self.settle_timer.timeout.connect(self.settleZoom)
+        
         self.dragging = False
         self.last_pos = None
         self.setMouseTracking(True)
@@ -51,6 +122,7 @@ class PDFPreviewLabel(QLabel):
         
         self.edit_mode = False
         self.text_overlays = {}
+        self.overlay_layers = {}  # Page number -> QImage with that page's overlays drawn
         
         # Cursor marker
         self.cursor_marker = QLabel(self)
@@ -79,57 +151,53 @@ class PDFPreviewLabel(QLabel):
                 int(self.original_pixmap.width() * self.zoom_factor),
                 int(self.original_pixmap.height() * self.zoom_factor)
             )
-            scaled_pixmap = self.original_pixmap.scaled(
-                zoomed_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            pixmap = scaled_pixmap.copy()
+            # Reuse the scaled page when this image was already shown at this size
+            cache_key = (self.original_pixmap.cacheKey(), zoomed_size.width(), zoomed_size.height())
+            scaled_pixmap = self.scaled_pixmaps.get(cache_key)
+            if scaled_pixmap is None and self.interacting:
+                # Intermediate wheel-zoom frames are not cached; settleZoom renders the final one
+                scaled_pixmap = self.original_pixmap.scaled(
+                    zoomed_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.FastTransformation
+                )
+            elif scaled_pixmap is None:
+                scaled_pixmap = self.original_pixmap.scaled(
+                    zoomed_size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                self.scaled_pixmaps.put(cache_key, scaled_pixmap)
             
-            # --- Highlight search results ---
             main_window = self.window()
-            if isinstance(main_window, PDFMan):
-                highlights = getattr(main_window, 'current_highlights', [])
-                if highlights:
-                    painter = QPainter(pixmap)
-                    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                    color = QColor(255, 255, 0, 120)  # semi-transparent yellow
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.setBrush(color)
-                    for rect in highlights:
-                        # Scale rectangle to match the pixmap size
-                        x = rect[0] * pixmap.width()
-                        y = rect[1] * pixmap.height()
-                        w = rect[2] * pixmap.width()
-                        h = rect[3] * pixmap.height()
-                        painter.drawRect(int(x), int(y), int(w), int(h))
-                    painter.end()
+            is_main_preview = isinstance(main_window, PDFMan)
+            highlights = getattr(main_window, 'current_highlights', []) if is_main_preview else []
+            has_overlays = is_main_preview and main_window.pdf_ops.current_page in self.text_overlays
+            
+            # Overlays are painted on a copy so the cached page stays clean; a bare page
+            # is shown straight from the cache
+            pixmap = scaled_pixmap.copy() if highlights or has_overlays else scaled_pixmap
+            
+            # --- Highlight search results ---
+            if highlights:
+                painter = QPainter(pixmap)
+                color = QColor(255, 255, 0, 120)  # semi-transparent yellow
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(color)
+                # Scale rectangles to match the pixmap size and draw them in one call
+                width, height = pixmap.width(), pixmap.height()
+                painter.drawRects([
+                    QRect(int(rect[0] * width), int(rect[1] * height), int(rect[2] * width), int(rect[3] * height))
+                    for rect in highlights
+                ])
+                painter.end()
             # --- End highlight ---
             
             # Add text overlays if any exist for the current page
-            main_window = self.window()
-            if isinstance(main_window, PDFMan) and main_window.pdf_ops.current_page in self.text_overlays:
+            if has_overlays:
+                # The overlays are rendered once per page and only composited here
                 painter = QPainter(pixmap)
-                painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
-                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                
-                for overlay in self.text_overlays[main_window.pdf_ops.current_page]:
-                    # Set up the font and color
-                    font = overlay.get('font', self.default_font)
-                    color = overlay.get('color', self.default_color)
-                    painter.setPen(QPen(color, 2))
-                    painter.setFont(font)
-                    
-                    # Get text metrics for proper alignment
-                    metrics = painter.fontMetrics()
-                    text = overlay['text']
-                    
-                    # Calculate text position with proper baseline alignment
-                    x = overlay['x']
-                    y = overlay['y'] + metrics.ascent()  # Add ascent to align with baseline
-                    
-                    # Draw the text
-                    painter.drawText(x, y, text)
+                painter.drawImage(0, 0, self.overlayLayer(main_window.pdf_ops.current_page))
                 painter.end()
             
             # Set the pixmap
@@ -141,56 +209,90 @@ class PDFPreviewLabel(QLabel):
             # Force the label to update its size and layout
             self.updateGeometry()
             self.update()
+            self.last_render_key = self.renderKey()
+
+    def overlayLayer(self, page_num):
+        """Get the page's text overlays drawn into a transparent image, rendering them on first use"""
+        layer = self.overlay_layers.get(page_num)
+        if layer is None:
+            overlays = self.text_overlays[page_num]
+            # Overlays sit at fixed view positions, so the layer only has to reach the furthest one
+            width = max(overlay['x'] + int(overlay['static_text'].size().width()) + 1 for overlay in overlays)
+            height = max(overlay['y'] + int(overlay['static_text'].size().height()) + 1 for overlay in overlays)
+            layer = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+            layer.fill(Qt.GlobalColor.transparent)
             
-            # Update the scroll area to show scroll bars when needed
-            if self.parent():
-                scroll_area = self.parent()
-                if isinstance(scroll_area, QScrollArea):
-                    # Force scroll area to update its geometry
-                    scroll_area.updateGeometry()
-                    scroll_area.update()
-                    
-                    # Update scroll bar ranges
-                    h_scroll = scroll_area.horizontalScrollBar()
-                    v_scroll = scroll_area.verticalScrollBar()
-                    
-                    if h_scroll and v_scroll:
-                        # Calculate the content size
-                        content_width = self.width()
-                        content_height = self.height()
-                        
-                        # Calculate the viewport size
-                        viewport_width = scroll_area.viewport().width()
-                        viewport_height = scroll_area.viewport().height()
-                        
-                        # Set scroll bar ranges
-                        h_scroll.setRange(0, max(0, content_width - viewport_width))
-                        v_scroll.setRange(0, max(0, content_height - viewport_height))
-                        
-                        # Force scroll bars to update
-                        h_scroll.update()
-                        v_scroll.update()
+            painter = QPainter(layer)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            
+            current_font = current_color = None
+            for overlay in overlays:
+                # Set up the font and color, only when they differ from the previous overlay's
+                font = overlay.get('font', self.default_font)
+                color = overlay.get('color', self.default_color)
+                if color != current_color:
+                    painter.setPen(QPen(color, 2))
+                    current_color = color
+                if font != current_font:
+                    painter.setFont(font)
+                    current_font = font
+                
+                # Draw the pre-laid-out text; static text is placed by its top-left
+                # corner, so no baseline adjustment is needed
+                painter.drawStaticText(overlay['x'], overlay['y'], overlay['static_text'])
+            painter.end()
+            self.overlay_layers[page_num] = layer
+        return layer
+
+    def renderKey(self):
+        """Describe what the last updatePixmap call rendered, to spot redundant redraws"""
+        main_window = self.window()
+        page = main_window.pdf_ops.current_page if isinstance(main_window, PDFMan) else None
+        pixmap_key = self.original_pixmap.cacheKey() if self.original_pixmap else None
+        return (self.width(), self.height(), self.zoom_factor, page, pixmap_key)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.updatePixmap()
+        # Qt often repeats resize events at an unchanged size; skip those
+        if self.renderKey() != self.last_render_key:
+            self.updatePixmap()
 
     def setZoom(self, factor):
         """Set the zoom factor for the preview"""
+        # An explicit zoom replaces any wheel zoom still waiting to be applied
+        self.zoom_timer.stop()
+        self.pending_zoom = None
         # Clamp zoom factor between min and max values
         self.zoom_factor = max(self.min_zoom, min(self.max_zoom, factor))
         self.updatePixmap()
         # Do not force scroll to top after zoom
 
+    def applyPendingZoom(self):
+        """Apply the zoom accumulated from wheel events"""
+        if self.pending_zoom is not None:
+            self.interacting = True
+            self.setZoom(self.pending_zoom)
+            self.settle_timer.start()
+
+    def settleZoom(self):
+        """Redraw the page with smooth scaling once wheel zooming has stopped"""
+        self.interacting = False
+        self.updatePixmap()
+
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming"""
         if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
             # Zoom in/out with Ctrl + mouse wheel
             delta = event.angleDelta().y()
+            zoom = self.pending_zoom if self.pending_zoom is not None else self.zoom_factor
             if delta > 0:
-                self.setZoom(self.zoom_factor * 1.1)  # Zoom in
+                zoom *= 1.1  # Zoom in
             else:
-                self.setZoom(self.zoom_factor / 1.1)  # Zoom out
+                zoom /= 1.1  # Zoom out
+            # Rescale once the wheel goes quiet instead of on every notch
+            self.pending_zoom = max(self.min_zoom, min(self.max_zoom, zoom))
+            self.zoom_timer.start()
             event.accept()
         else:
             super().wheelEvent(event)  # Normal scrolling
@@ -205,7 +307,7 @@ class PDFPreviewLabel(QLabel):
             main_window = self.window()
             if isinstance(main_window, PDFMan):
                 # Show text properties dialog
-                dialog = TextPropertiesDialog(main_window)
+                dialog = main_window.get_text_properties_dialog()
                 if dialog.exec():
                     # Get text properties
                     props = dialog.get_text_properties()
@@ -213,6 +315,11 @@ class PDFPreviewLabel(QLabel):
                     # Create a text input dialog
                     text, ok = QInputDialog.getText(main_window, 'Add Text', 'Enter text to add:')
                     if ok and text:
+                        # Lay the text out once so repaints only have to draw it
+                        static_text = QStaticText(text)
+                        static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+                        static_text.prepare(QTransform(), props['font'])
+                        
                         # Store the text overlay with its position and properties
                         page_num = main_window.pdf_ops.current_page
                         if page_num not in self.text_overlays:
@@ -222,8 +329,11 @@ class PDFPreviewLabel(QLabel):
                             'x': pos.x(),
                             'y': pos.y(),
                             'font': props['font'],
-                            'color': props['color']
+                            'color': props['color'],
+                            'static_text': static_text
                         })
+                        # Redraw this page's overlay layer on next use
+                        self.overlay_layers.pop(page_num, None)
                         
                         # Update the preview to show the new text
                         self.updatePixmap()
@@ -325,6 +435,23 @@ class DraggablePagePreview(QWidget):
         # Selection state
         self.is_selected = False
         self.rotation = 0  # Track rotation in degrees
+        
+        self.thumbnail_loaded = False
+    
+    def showEvent(self, event):
+        """Have the main window check for thumbnails to load once layout settles"""
+        super().showEvent(event)
+        if not self.thumbnail_loaded:
+            main_window = self.window()
+            if isinstance(main_window, PDFMan):
+                main_window.thumbnail_timer.start(0)
+    
+    def set_thumbnail(self, pixmap):
+        """Show the page thumbnail, or the page number if there is none"""
+        if pixmap is not None:
+            self.preview_label.setPixmap(pixmap)
+        else:
+            self.preview_label.setText(f"Page {self.page_num + 1}")
     
     def show_context_menu(self, position):
         """Show the context menu on right-click"""
@@ -441,7 +568,6 @@ class TextPropertiesDialog(QDialog):
         font_layout = QHBoxLayout()
         font_layout.addWidget(QLabel("Font:"))
         self.font_combo = QFontComboBox()
-        self.font_combo.setCurrentFont(QFont("Arial"))
         font_layout.addWidget(self.font_combo)
         layout.addLayout(font_layout)
         
@@ -450,7 +576,6 @@ class TextPropertiesDialog(QDialog):
         size_layout.addWidget(QLabel("Size:"))
         self.size_spin = QSpinBox()
         self.size_spin.setRange(8, 72)
-        self.size_spin.setValue(12)
         size_layout.addWidget(self.size_spin)
         layout.addLayout(size_layout)
         
@@ -459,7 +584,6 @@ class TextPropertiesDialog(QDialog):
         color_layout.addWidget(QLabel("Color:"))
         self.color_button = QPushButton()
         self.color_button.setFixedSize(30, 30)
-        self.color_button.setStyleSheet("background-color: red;")
         self.color_button.clicked.connect(self.choose_color)
         color_layout.addWidget(self.color_button)
         layout.addLayout(color_layout)
@@ -488,8 +612,14 @@ class TextPropertiesDialog(QDialog):
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
         
-        # Initialize color
+        self.reset_defaults()
+    
+    def reset_defaults(self):
+        """Restore the default font, size and color so the dialog can be reused"""
         self.selected_color = QColor(Qt.GlobalColor.red)
+        self.color_button.setStyleSheet("background-color: red;")
+        self.font_combo.setCurrentFont(QFont("Arial"))
+        self.size_spin.setValue(12)
         self.update_preview()
     
     def choose_color(self):
@@ -513,40 +643,138 @@ class TextPropertiesDialog(QDialog):
             'color': self.selected_color
         }
 
+def read_page_text(reader, preview, cache):
+    """Run EasyOCR on a page preview, reusing the stored result for an identical image"""
+    digest = hashlib.blake2b(f"{preview.mode}{preview.size}".encode(), digest_size=16)
+    digest.update(preview.tobytes())
+    key = digest.hexdigest()
+    results = cache.pop(key, None)
+    if results is None:
+        # Previews rendered above the default DPI are scaled down for OCR; text is
+        # legible at that size and recognition time grows with the pixel count
+        scale = min(1.0, OCR_MAX_SIZE / max(preview.size))
+        image = preview
+        if scale < 1.0:
+            image = preview.resize((round(preview.width * scale), round(preview.height * scale)), Image.Resampling.BILINEAR)
+        # Store plain floats in preview coordinates so the results can be written out as JSON
+        results = [
+            ([[float(x) / scale, float(y) / scale] for x, y in bbox], text, float(conf))
+            for bbox, text, conf in reader.readtext(np.array(image), detail=1, paragraph=False)
+        ]
+    # Reinserting keeps the most recently used pages at the end
+    cache[key] = results
+    return results
+
 class OCRSearchThread(QThread):
     finished = pyqtSignal(list)
-    def __init__(self, reader, previews, term):
+    def __init__(self, reader, previews, term, cache):
         super().__init__()
         self.reader = reader
         self.previews = previews
         self.term = term
+        self.cache = cache
     def run(self):
-        import numpy as np
         results = []
+        term = self.term.lower()
         for i, preview in enumerate(self.previews):
             if preview is None:
                 continue
-            img = np.array(preview)
-            ocr_results = self.reader.readtext(img, detail=1, paragraph=False)
-            for bbox, text, conf in ocr_results:
-                words = text.split()
-                for word in words:
-                    if self.term.lower() == word.lower():
-                        results.append(i)
-                        break
-                else:
-                    continue
-                break
+            ocr_results = read_page_text(self.reader, preview, self.cache)
+            # A page matches once any recognised text contains the term, as in the standard search
+            if any(term in text.lower() for bbox, text, conf in ocr_results):
+                results.append(i)
         self.finished.emit(results)
 
+class PreviewSignals(QObject):
+    ready = pyqtSignal(object, object)
+
+class PreviewRenderTask(QRunnable):
+    """Scale a page preview and convert it to a QImage on a worker thread"""
+    # Largest preview dimension shown in the viewer
+    MAX_SIZE = 1200
+    # QImage format and bytes per pixel for PIL modes Qt can read directly
+    QT_FORMATS = {
+        'RGB': (QImage.Format.Format_RGB888, 3),
+        'RGBA': (QImage.Format.Format_RGBA8888, 4),
+        'L': (QImage.Format.Format_Grayscale8, 1),
+    }
+    def __init__(self, cache_key, preview, resize):
+        super().__init__()
+        self.cache_key = cache_key
+        self.preview = preview
+        self.resize = resize
+        self.signals = PreviewSignals()
+    def run(self):
+        try:
+            preview = self.preview
+            logger.debug(f"Converting preview image: size={preview.size}, mode={preview.mode}")
+            
+            # Resize the image to a more manageable size before conversion
+            if preview.size[0] > self.MAX_SIZE or preview.size[1] > self.MAX_SIZE:
+                ratio = min(self.MAX_SIZE / preview.size[0], self.MAX_SIZE / preview.size[1])
+                new_size = (int(preview.size[0] * ratio), int(preview.size[1] * ratio))
+                preview = self.resize(preview, new_size)
+                logger.debug(f"Resized image to: {new_size}")
+            
+            # Hand RGB, RGBA and greyscale pixels to Qt as they are; convert anything else to RGB
+            if preview.mode not in self.QT_FORMATS:
+                preview = preview.convert('RGB')
+            qt_format, channels = self.QT_FORMATS[preview.mode]
+            
+            # QImage is safe to build off the GUI thread; copy it so it owns its pixels
+            img_data = preview.tobytes()
+            qimg = QImage(img_data, preview.size[0], preview.size[1], preview.size[0] * channels, qt_format).copy()
+            if qimg.isNull():
+                raise Exception("Failed to create QImage from preview")
+            self.signals.ready.emit(self.cache_key, qimg)
+        except Exception as e:
+            logger.error(f"Error converting preview image: {str(e)}")
+            logger.error(traceback.format_exc())
+            self.signals.ready.emit(self.cache_key, None)
+
+class ThumbnailRenderTask(QRunnable):
+    """Shrink a page preview to an arrange-tab thumbnail on a worker thread"""
+    SIZE = (150, 200)
+    def __init__(self, key, preview):
+        super().__init__()
+        self.key = key
+        self.preview = preview
+        self.signals = PreviewSignals()
+    def run(self):
+        try:
+            # Resize the preview to fit the label, box-reducing it first as Image.thumbnail does
+            preview = self.preview.resize(self.SIZE, THUMBNAIL_RESAMPLE, reducing_gap=2.0)
+            
+            # Convert to RGB only if Qt cannot read the mode directly
+            if preview.mode not in PreviewRenderTask.QT_FORMATS:
+                preview = preview.convert('RGB')
+            qt_format, channels = PreviewRenderTask.QT_FORMATS[preview.mode]
+            
+            img_data = preview.tobytes()
+            qimg = QImage(img_data, preview.size[0], preview.size[1], preview.size[0] * channels, qt_format).copy()
+            self.signals.ready.emit(self.key, qimg)
+        except Exception as e:
+            logger.error(f"Error creating preview for page {self.key[1] + 1}: {str(e)}")
+            self.signals.ready.emit(self.key, None)
+
+class CombinePDFsThread(QThread):
+    finished = pyqtSignal(bool)
+    def __init__(self, pdf_ops, pdf_files, output_file):
+        super().__init__()
+        self.pdf_ops = pdf_ops
+        self.pdf_files = pdf_files
+        self.output_file = output_file
+    def run(self):
+        self.finished.emit(self.pdf_ops.combine_pdfs(self.pdf_files, self.output_file))
+
 class SpinnerDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, message="Processing OCR... Please wait."):
         super().__init__(parent)
         self.setWindowTitle("Processing...")
         self.setModal(True)
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.FramelessWindowHint)
         layout = QVBoxLayout(self)
-        self.label = QLabel("Processing OCR... Please wait.")
+        self.label = QLabel(message)
         layout.addWidget(self.label)
         # Try to use a spinner GIF if available
         try:
@@ -562,6 +790,9 @@ class SpinnerDialog(QDialog):
 
 class PDFMan(QMainWindow):
     RECENT_FILES_PATH = "recent_files.json"
+    # Recognised page text is kept in the user's cache folder, next to the cached previews
+    OCR_CACHE_PATH = os.path.join(PREVIEW_CACHE_DIR, "ocr_cache.json")
+    MAX_OCR_CACHE_PAGES = 500
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PDFMan")
@@ -570,6 +801,32 @@ class PDFMan(QMainWindow):
         # Initialize PDF operations
         self.pdf_ops = PDFOperations()
         
+        # Converted page previews, keyed by preview generation and page number
+        self.preview_pixmaps = PixmapCache()
+        
+        # Previews are scaled on a single worker so the shared resizer is never used concurrently
+        self.preview_pool = QThreadPool()
+        self.preview_pool.setMaxThreadCount(1)
+        self.pending_preview_key = None
+        
+        # Arrange-tab thumbnails are kept in Qt's shared pixmap cache (limit in KB)
+        QPixmapCache.setCacheLimit(50 * 1024)
+        # Thumbnails being converted on the global thread pool
+        self.pending_thumbnails = set()
+        # Live preview image id -> (weak reference, cache name) of its thumbnail
+        self.thumbnail_names = {}
+        self.thumbnail_serials = itertools.count()
+        
+        # One resizer is reused for every preview
+        if Resizer is not None:
+            self.resizer = Resizer()
+            self.resize_options = ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+        else:
+            self.resizer = None
+        # Otherwise the Numba resampler is loaded by the first resize that needs it
+        self.numba_resize = None
+        self.numba_checked = False
+        
         # Initialize selection tracking
         self.selected_pages = set()
         self.last_selected_page = None
@@ -578,6 +835,9 @@ class PDFMan(QMainWindow):
         self.undo_stack = []
         self.redo_stack = []
         
+        # Built on first use; its font list is slow to populate
+        self.text_properties_dialog = None
+        
         # Initialize recent files
         self.recent_files = []
         self.max_recent_files = 10
@@ -595,6 +855,14 @@ class PDFMan(QMainWindow):
         # Set up the UI
         self.setup_ui()
     
+    def get_text_properties_dialog(self):
+        """Get the shared text properties dialog, reset to its defaults"""
+        if self.text_properties_dialog is None:
+            self.text_properties_dialog = TextPropertiesDialog(self)
+        else:
+            self.text_properties_dialog.reset_defaults()
+        return self.text_properties_dialog
+    
     def load_recent_files(self):
         try:
             if os.path.exists(self.RECENT_FILES_PATH):
@@ -732,27 +1000,27 @@ class PDFMan(QMainWindow):
         toolbar.setIconSize(QSize(24, 24))
         self.addToolBar(toolbar)
         # Open action
-        open_action = QAction(QIcon("icons/open.png"), "Open", self)
+        open_action = QAction(get_icon("open"), "Open", self)
         open_action.setShortcut("Ctrl+O")
         open_action.triggered.connect(self.browse_pdf)
         toolbar.addAction(open_action)
         # Save action
-        save_action = QAction(QIcon("icons/save.png"), "Save", self)
+        save_action = QAction(get_icon("save"), "Save", self)
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self.save_pdf)
         toolbar.addAction(save_action)
         # Save As action
-        save_as_action = QAction(QIcon("icons/save_as.png"), "Save As", self)
+        save_as_action = QAction(get_icon("save_as"), "Save As", self)
         save_as_action.setShortcut("Ctrl+Shift+S")
         save_as_action.triggered.connect(self.save_as_pdf)
         toolbar.addAction(save_as_action)
         # Edit action
-        edit_action = QAction(QIcon("icons/edit.png"), "Edit", self)
+        edit_action = QAction(get_icon("edit"), "Edit", self)
         edit_action.setShortcut("Ctrl+E")
         edit_action.triggered.connect(self.toggle_edit_mode)
         toolbar.addAction(edit_action)
         # Close action
-        close_action = QAction(QIcon("icons/close.png"), "Close", self)
+        close_action = QAction(get_icon("close"), "Close", self)
         close_action.setShortcut("Ctrl+W")
         close_action.triggered.connect(self.close_document)
         toolbar.addAction(close_action)
@@ -784,6 +1052,7 @@ class PDFMan(QMainWindow):
         self.current_match_index = -1
         self.current_highlights = []
         self.ocr_reader = None  # Will be initialized on first use
+        self.ocr_cache = {}  # Image hash -> EasyOCR results, loaded with the reader
 
     def clear_search(self):
         self.search_bar.setText("")
@@ -827,19 +1096,52 @@ class PDFMan(QMainWindow):
             self.current_highlights = []
             self.update_preview()
 
-    def perform_ocr_search(self, term):
-        # Use EasyOCR to search all pages in a background thread
+    def get_ocr_reader(self):
+        """Get the EasyOCR reader, creating it and loading stored OCR results on first use"""
         if self.ocr_reader is None:
+            # EasyOCR pulls in PyTorch, so it is only imported once OCR is first used
+            import easyocr
             self.ocr_reader = easyocr.Reader(['en'], gpu=False)
+            self.load_ocr_cache()
+        return self.ocr_reader
+
+    def load_ocr_cache(self):
+        try:
+            if os.path.exists(self.OCR_CACHE_PATH):
+                with open(self.OCR_CACHE_PATH, 'r', encoding='utf-8') as f:
+                    self.ocr_cache = json.load(f)
+        except Exception:
+            self.ocr_cache = {}
+
+    def save_ocr_cache(self):
+        try:
+            # Only the most recently used pages are kept
+            for key in list(self.ocr_cache)[:-self.MAX_OCR_CACHE_PAGES]:
+                del self.ocr_cache[key]
+            os.makedirs(os.path.dirname(self.OCR_CACHE_PATH), exist_ok=True)
+            with open(self.OCR_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self.ocr_cache, f)
+        except Exception:
+            pass
+
+    def perform_ocr_search(self, term):
+        # Use EasyOCR to search all pages in a background thread
+        reader = self.get_ocr_reader()
         previews = [self.pdf_ops.get_preview(i) for i in range(self.pdf_ops.get_total_pages())]
+        # Decode lazily loaded previews here; the viewer and thumbnails share these images,
+        # so the search thread only reads their pixels
+        for preview in previews:
+            if preview is not None:
+                preview.load()
         self.spinner_dialog = SpinnerDialog(self)
-        self.ocr_thread = OCRSearchThread(self.ocr_reader, previews, term)
+        self.ocr_thread = OCRSearchThread(reader, previews, term, self.ocr_cache)
         self.ocr_thread.finished.connect(self.ocr_search_finished)
         self.ocr_thread.start()
         self.spinner_dialog.show()
 
     def ocr_search_finished(self, results):
         self.spinner_dialog.close()
+        self.save_ocr_cache()
         self.search_results = results
         if self.search_results:
             self.current_match_index = 0
@@ -853,38 +1155,41 @@ class PDFMan(QMainWindow):
 
     def show_ocr_highlights_for_page(self, page_num, term):
         self.current_highlights = []
-        if self.ocr_reader is None:
-            self.ocr_reader = easyocr.Reader(['en'], gpu=False)
+        reader = self.get_ocr_reader()
         preview = self.pdf_ops.get_preview(page_num)
-        if preview is None:
+        # An empty term would match at every offset
+        if preview is None or not term:
             self.update_preview()
             return
-        img = np.array(preview)
-        results = self.ocr_reader.readtext(img, detail=1, paragraph=False)
+        # The search has usually just read this page, so this is a cache hit
+        results = read_page_text(reader, preview, self.ocr_cache)
         img_width, img_height = preview.size
+        term = term.lower()
         for bbox, text, conf in results:
-            # Split detected text into words and check each word
-            words = text.split()
-            for idx, word in enumerate(words):
-                if term.lower() == word.lower():
-                    # Estimate word bbox within the detected bbox
-                    # Assume words are evenly spaced in the bbox
-                    x_coords = [pt[0] for pt in bbox]
-                    y_coords = [pt[1] for pt in bbox]
-                    x0 = min(x_coords)
-                    y0 = min(y_coords)
-                    x1 = max(x_coords)
-                    y1 = max(y_coords)
-                    total_words = len(words)
-                    word_width = (x1 - x0) / total_words
-                    wx0 = x0 + idx * word_width
-                    wx1 = wx0 + word_width
-                    # Normalize
-                    x = wx0 / img_width
-                    y = y0 / img_height
-                    w = (wx1 - wx0) / img_width
-                    h = (y1 - y0) / img_height
-                    self.current_highlights.append((x, y, w, h))
+            # Find every occurrence of the term in the detected text
+            text = text.lower()
+            start = text.find(term)
+            if start < 0:
+                continue
+            x_coords = [pt[0] for pt in bbox]
+            y_coords = [pt[1] for pt in bbox]
+            x0 = min(x_coords)
+            y0 = min(y_coords)
+            x1 = max(x_coords)
+            y1 = max(y_coords)
+            # Estimate the match's bbox within the detected bbox
+            # Assume characters are evenly spaced in the bbox
+            char_width = (x1 - x0) / len(text)
+            while start >= 0:
+                wx0 = x0 + start * char_width
+                wx1 = wx0 + len(term) * char_width
+                # Normalize
+                x = wx0 / img_width
+                y = y0 / img_height
+                w = (wx1 - wx0) / img_width
+                h = (y1 - y0) / img_height
+                self.current_highlights.append((x, y, w, h))
+                start = text.find(term, start + len(term))
         self.update_preview()
 
     def goto_next_match(self):
@@ -945,11 +1250,13 @@ class PDFMan(QMainWindow):
         left_layout.setSpacing(0)
         left_layout.setStretch(0, 1)
         scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(False)
+        # Let the scroll area size the label and its scroll bars from the label's minimum size
+        scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         self.preview_label = PDFPreviewLabel()
+        self.preview_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         scroll_area.setWidget(self.preview_label)
         self.scroll_area = scroll_area
         left_layout.addWidget(scroll_area, stretch=1)
@@ -1022,6 +1329,7 @@ class PDFMan(QMainWindow):
         self.setup_arrange_tab()
         self.setup_compare_tab()
         self.setup_combine_tab()
+        self.tabs.currentChanged.connect(self.refresh_arrange_tab)
         self.splitter.setSizes([self.width(), 0])
         main_layout.addWidget(self.splitter, stretch=1)
         self.toggle_right_panel_btn = QPushButton("▶")
@@ -1066,6 +1374,7 @@ class PDFMan(QMainWindow):
             self.toggle_right_panel_btn.setText("◀")
             self.splitter.setSizes([int(self.width() * 0.8), int(self.width() * 0.2)])
             self.right_panel_in_splitter = True
+            self.refresh_arrange_tab()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -1272,9 +1581,13 @@ class PDFMan(QMainWindow):
         # Clear the current document
         self.pdf_ops.current_pdf = None
         self.pdf_ops.current_path = None
+        self.pdf_ops.writer = None
+        self.pdf_ops.invalidate_reader()
         self.pdf_ops.preview_images = []
         self.pdf_ops.current_page = 0
         self.pdf_ops.modified = False
+        self.preview_pixmaps.clear()
+        self.preview_label.scaled_pixmaps.clear()
         self.pdf_ops.unsaved_changes = False
         
         # Update the UI
@@ -1348,54 +1661,22 @@ class PDFMan(QMainWindow):
     def swap_pages(self, source_page, target_page):
         """Swap two pages in the preview list"""
         # Find indices of the pages
-        source_idx = self.page_previews.index(source_page)
-        target_idx = self.page_previews.index(target_page)
+        source_idx = self.page_positions[source_page]
+        target_idx = self.page_positions[target_page]
         
         # Swap the page numbers
         self.page_previews[source_idx], self.page_previews[target_idx] = \
             self.page_previews[target_idx], self.page_previews[source_idx]
+        self.page_positions[source_page], self.page_positions[target_page] = target_idx, source_idx
         
-        # Remove all widgets from the grid
-        while self.pages_grid.count():
-            item = self.pages_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Clear the page labels list
-        self.page_labels.clear()
-        
-        # Re-add widgets in the new order
-        for i, page_num in enumerate(self.page_previews):
-            # Create a new container for this page
-            container = DraggablePagePreview(page_num)
-            
-            # Get the preview image
-            preview = self.pdf_ops.get_preview(page_num)
-            if preview:
-                try:
-                    # Resize the preview to fit the label
-                    preview = preview.resize((150, 200), Image.Resampling.LANCZOS)
-                    
-                    # Convert to RGB if needed
-                    if preview.mode != 'RGB':
-                        preview = preview.convert('RGB')
-                    
-                    # Convert to QPixmap
-                    img_data = preview.tobytes("raw", "RGB")
-                    qimg = QImage(img_data, preview.size[0], preview.size[1], QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qimg)
-                    container.preview_label.setPixmap(pixmap)
-                except Exception as e:
-                    logger.error(f"Error creating preview for page {page_num + 1}: {str(e)}")
-                    container.preview_label.setText(f"Page {page_num + 1}")
-            
-            # Add to grid
-            row = i // 3
-            col = i % 3
-            self.pages_grid.addWidget(container, row, col)
-            
-            # Store reference
-            self.page_labels.append(container)
+        # Move the two preview widgets into each other's grid cells; the rest stay put
+        source_widget = self.page_labels[source_idx]
+        target_widget = self.page_labels[target_idx]
+        self.pages_grid.removeWidget(source_widget)
+        self.pages_grid.removeWidget(target_widget)
+        self.pages_grid.addWidget(source_widget, target_idx // 3, target_idx % 3)
+        self.pages_grid.addWidget(target_widget, source_idx // 3, source_idx % 3)
+        self.page_labels[source_idx], self.page_labels[target_idx] = target_widget, source_widget
         
         # Mark changes as unsaved
         self.pdf_ops.unsaved_changes = True
@@ -1415,37 +1696,13 @@ class PDFMan(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Create a new PDF writer
-                writer = PdfWriter()
-                
-                # Add all pages except the one to be removed
-                for i in range(self.pdf_ops.get_total_pages()):
-                    if i != page_num:
-                        page = self.pdf_ops.get_page(i)
-                        if page:
-                            writer.add_page(page)
-                
-                # Save to a temporary file
-                temp_file = "temp_removed.pdf"
-                with open(temp_file, 'wb') as output_file:
-                    writer.write(output_file)
-                
-                # Reload the PDF with the page removed
-                self.handle_pdf_file(temp_file)
-                
-                # Delete the temporary file
-                os.remove(temp_file)
-                
+            # Remove the page from the in-memory document; undoable like any other edit
+            command = RemovePagesCommand(self.pdf_ops, [page_num])
+            if self.execute_command(command):
+                # Selected page numbers after the removed page no longer match
+                self.selected_pages.clear()
+                self.last_selected_page = None
                 self.status_bar.showMessage(f"Page {page_num + 1} removed")
-            except Exception as e:
-                logger.error(f"Error removing page: {str(e)}")
-                logger.error(traceback.format_exc())
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"An error occurred while removing the page: {str(e)}"
-                )
 
     def toggle_edit_mode(self):
         """Toggle edit mode for adding text overlays"""
@@ -1497,8 +1754,6 @@ class PDFMan(QMainWindow):
         if self.execute_command(command):
             QMessageBox.information(self, "Success", "Page order has been updated successfully!")
             self.status_bar.showMessage("Page order updated")
-            # Reload the PDF to show the new order
-            self.handle_pdf_file(self.pdf_ops.current_path)
 
     def setup_arrange_tab(self):
         """Set up the arrange tab for page management"""
@@ -1538,6 +1793,14 @@ class PDFMan(QMainWindow):
         scroll_area.setWidget(self.arrange_container)
         layout.addWidget(scroll_area)
         
+        # Thumbnails are only converted for previews scrolled into view
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.timeout.connect(self.load_visible_thumbnails)
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(lambda: self.thumbnail_timer.start(0))
+        scroll_bar.rangeChanged.connect(lambda: self.thumbnail_timer.start(0))
+        
         # Button to apply changes
         self.apply_arrange_btn = QPushButton("Apply Changes")
         self.apply_arrange_btn.setStyleSheet("""
@@ -1562,47 +1825,101 @@ class PDFMan(QMainWindow):
         
         # Store references to page previews
         self.page_previews = []
+        self.page_positions = {}  # Page number -> index in page_previews
+        self.arrange_dirty = False  # Set when the document changes while the tab is hidden
         self.page_labels = []
 
+    def load_visible_thumbnails(self):
+        """Request thumbnails for arrange-tab previews that are inside the scroll area's viewport"""
+        for container in self.page_labels:
+            if not container.thumbnail_loaded and not container.visibleRegion().isEmpty():
+                container.thumbnail_loaded = True
+                self.request_page_thumbnail(container.page_num)
+    
+    def refresh_arrange_tab(self):
+        """Rebuild the arrange tab if the document changed while it was hidden"""
+        if self.arrange_dirty:
+            self.update_arrange_tab()
+    
+    def thumbnail_name(self, preview):
+        """Get the pixmap cache name of a preview image's thumbnail"""
+        # Previews move with their pages and are replaced when a page is rotated or reloaded,
+        # so reordered, duplicated and undone pages keep their thumbnails
+        entry = self.thumbnail_names.get(id(preview))
+        if entry is None or entry[0]() is not preview:
+            preview_id = id(preview)
+            ref = weakref.ref(preview, lambda ref: self.thumbnail_names.pop(preview_id, None))
+            entry = (ref, f"thumbnail-{next(self.thumbnail_serials)}")
+            self.thumbnail_names[preview_id] = entry
+        return entry[1]
+    
+    def request_page_thumbnail(self, page_num):
+        """Show a page's arrange-tab thumbnail, converting its preview on a worker thread only once"""
+        preview = self.pdf_ops.get_preview(page_num)
+        if not preview:
+            self.set_page_thumbnail(page_num, None)
+            return
+        name = self.thumbnail_name(preview)
+        pixmap = QPixmapCache.find(name)
+        if pixmap is not None:
+            self.set_page_thumbnail(page_num, pixmap)
+            return
+        # The preview generation in the key drops results for pages edited in the meantime
+        key = (self.pdf_ops.preview_generation, page_num, name)
+        if key in self.pending_thumbnails:
+            return
+        
+        # Decode lazily loaded images here; the worker only reads the pixels
+        preview.load()
+        self.pending_thumbnails.add(key)
+        task = ThumbnailRenderTask(key, preview)
+        task.signals.ready.connect(self.on_thumbnail_ready)
+        QThreadPool.globalInstance().start(task)
+    
+    def on_thumbnail_ready(self, key, qimg):
+        """Cache a thumbnail converted by a ThumbnailRenderTask and show it if it is still current"""
+        self.pending_thumbnails.discard(key)
+        generation, page_num, name = key
+        pixmap = None
+        if qimg is not None:
+            pixmap = QPixmap.fromImage(qimg)
+            QPixmapCache.insert(name, pixmap)
+        if generation == self.pdf_ops.preview_generation:
+            self.set_page_thumbnail(page_num, pixmap)
+    
+    def set_page_thumbnail(self, page_num, pixmap):
+        """Show a thumbnail on every arrange-tab preview of the page"""
+        for container in self.page_labels:
+            if container.page_num == page_num:
+                container.set_thumbnail(pixmap)
+    
     def update_arrange_tab(self):
         """Update the arrange tab with current page previews"""
+        # Only build the grid while it can be seen; refresh_arrange_tab catches up when it is shown
+        if not self.arrange_tab.isVisible():
+            self.arrange_dirty = True
+            return
+        self.arrange_dirty = False
+        
         # Clear existing previews
         for label in self.page_labels:
             self.pages_grid.removeWidget(label)
             label.deleteLater()
         self.page_labels.clear()
         self.page_previews.clear()
+        self.page_positions.clear()
         
         if not self.pdf_ops.current_pdf:
             return
         
-        # Get all page previews
+        # Get all page previews; repaint once after every widget is in the grid
+        self.arrange_container.setUpdatesEnabled(False)
         total_pages = self.pdf_ops.get_total_pages()
         for page_num in range(total_pages):
-            preview = self.pdf_ops.get_preview(page_num)
-            if preview:
-                # Create draggable preview widget
+            if self.pdf_ops.get_preview(page_num):
+                # Create draggable preview widget; its thumbnail is loaded when first shown
                 container = DraggablePagePreview(page_num)
                 
-                # Convert PIL Image to QPixmap
-                try:
-                    # Resize the preview to fit the label while maintaining aspect ratio
-                    target_size = (150, 200)
-                    preview = preview.resize(target_size, Image.Resampling.LANCZOS)
-                    
-                    # Convert to RGB if needed
-                    if preview.mode != 'RGB':
-                        preview = preview.convert('RGB')
-                    
-                    # Convert to QPixmap directly
-                    img_data = preview.tobytes("raw", "RGB")
-                    qimg = QImage(img_data, preview.size[0], preview.size[1], preview.size[0] * 3, QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qimg)
-                    container.preview_label.setPixmap(pixmap)
-                except Exception as e:
-                    logger.error(f"Error creating preview for page {page_num + 1}: {str(e)}")
-                    container.preview_label.setText(f"Page {page_num + 1}")
-                
                 # Add container to grid
                 row = page_num // 3  # 3 previews per row
                 col = page_num % 3
@@ -1610,7 +1927,9 @@ class PDFMan(QMainWindow):
                 
                 # Store references
                 self.page_labels.append(container)
+                self.page_positions[page_num] = len(self.page_previews)
                 self.page_previews.append(page_num)
+        self.arrange_container.setUpdatesEnabled(True)
         
         # Enable the apply button
         self.apply_arrange_btn.setEnabled(True)
@@ -1732,6 +2051,8 @@ class PDFMan(QMainWindow):
         self.second_pdf_path = None
         self.second_pdf_ops = None
         self.current_page_second = 0
+        # Converted second-PDF pages, keyed by page number; the second PDF is never edited
+        self.second_pixmaps = PixmapCache()
         
         # Connect navigation signals
         self.prev_page_second.clicked.connect(self.prev_page_second_pdf)
@@ -1892,24 +2213,27 @@ class PDFMan(QMainWindow):
             return
         
         # Get all PDF files from the list
-        pdf_files = []
-        for i in range(self.combine_list.count()):
-            pdf_files.append(self.combine_list.item(i).text())
+        pdf_files = [self.combine_list.item(i).text() for i in range(self.combine_list.count())]
         
-        try:
-            # Combine the PDFs
-            if self.pdf_ops.combine_pdfs(pdf_files, output_file):
-                QMessageBox.information(self, "Success", 
-                                      "PDFs have been combined successfully!")
-                self.status_bar.showMessage(f"Combined PDFs saved as: {output_file}")
-            else:
-                QMessageBox.critical(self, "Error", 
-                                   "Failed to combine PDFs.")
-        except Exception as e:
-            logger.error(f"Error combining PDFs: {str(e)}")
-            logger.error(traceback.format_exc())
+        # Combine the PDFs in a background thread so the window keeps repainting
+        self.combine_btn.setEnabled(False)
+        self.combine_output_file = output_file
+        self.spinner_dialog = SpinnerDialog(self, "Combining PDFs... Please wait.")
+        self.combine_thread = CombinePDFsThread(self.pdf_ops, pdf_files, output_file)
+        self.combine_thread.finished.connect(self.combine_pdfs_finished)
+        self.combine_thread.start()
+        self.spinner_dialog.show()
+
+    def combine_pdfs_finished(self, success):
+        self.spinner_dialog.close()
+        self.combine_btn.setEnabled(self.combine_list.count() >= 2)
+        if success:
+            QMessageBox.information(self, "Success", 
+                                  "PDFs have been combined successfully!")
+            self.status_bar.showMessage(f"Combined PDFs saved as: {self.combine_output_file}")
+        else:
             QMessageBox.critical(self, "Error", 
-                               f"An error occurred while combining PDFs: {str(e)}")
+                               "Failed to combine PDFs.")
 
     def browse_second_pdf(self):
         """Open file dialog to select second PDF for comparison"""
@@ -1926,6 +2250,7 @@ class PDFMan(QMainWindow):
                 self.second_pdf_ops = PDFOperations()
                 self.second_pdf_ops.load_pdf(file_path)
                 self.second_pdf_path = file_path
+                self.second_pixmaps.clear()
                 
                 # Update UI
                 self.current_page_second = 0
@@ -1958,21 +2283,25 @@ class PDFMan(QMainWindow):
                 image = self.second_pdf_ops.get_preview(self.current_page_second)
                 if image:
                     try:
-                        # Resize the image to a more manageable size before conversion
-                        max_size = 1200  # Maximum dimension size for better quality
-                        if image.size[0] > max_size or image.size[1] > max_size:
-                            ratio = min(max_size / image.size[0], max_size / image.size[1])
-                            new_size = (int(image.size[0] * ratio), int(image.size[1] * ratio))
-                            image = image.resize(new_size, Image.Resampling.LANCZOS)
-                        
-                        # Convert to RGB if not already
-                        if image.mode != 'RGB':
-                            image = image.convert('RGB')
-                        
-                        # Convert PIL Image to QPixmap directly
-                        img_data = image.tobytes("raw", "RGB")
-                        qimg = QImage(img_data, image.size[0], image.size[1], image.size[0] * 3, QImage.Format.Format_RGB888)
-                        pixmap = QPixmap.fromImage(qimg)
+                        pixmap = self.second_pixmaps.get(self.current_page_second)
+                        if pixmap is None:
+                            # Resize the image to a more manageable size before conversion
+                            max_size = 1200  # Maximum dimension size for better quality
+                            if image.size[0] > max_size or image.size[1] > max_size:
+                                ratio = min(max_size / image.size[0], max_size / image.size[1])
+                                new_size = (int(image.size[0] * ratio), int(image.size[1] * ratio))
+                                image = image.resize(new_size, Image.Resampling.LANCZOS)
+                            
+                            # Convert to RGB if not already
+                            if image.mode != 'RGB':
+                                image = image.convert('RGB')
+                            
+                            # Convert PIL Image to QPixmap directly
+                            img_data = image.tobytes("raw", "RGB")
+                            qimg = QImage(img_data, image.size[0], image.size[1], image.size[0] * 3, QImage.Format.Format_RGB888)
+                            pixmap = QPixmap.fromImage(qimg)
+                            
+                            self.second_pixmaps.put(self.current_page_second, pixmap)
                         
                         # Set the pixmap
                         self.second_pdf_viewer.setPixmap(pixmap)
@@ -2068,6 +2397,9 @@ class PDFMan(QMainWindow):
             # Create preview label for the difference image
             diff_label = PDFPreviewLabel()
             
+            # Difference images already computed in this window, keyed by both page numbers
+            diff_pixmaps = PixmapCache()
+            
             def update_difference_view():
                 """Update the difference view with current pages"""
                 try:
@@ -2085,13 +2417,13 @@ class PDFMan(QMainWindow):
                     prev_page2_btn.setEnabled(current_page2 > 0)
                     next_page2_btn.setEnabled(current_page2 < self.second_pdf_ops.get_total_pages() - 1)
                     
-                    # Get pages and convert to images
-                    page1 = self.pdf_ops.get_page(current_page1)
-                    page2 = self.second_pdf_ops.get_page(current_page2)
-                    
-                    if not page1 or not page2:
+                    diff_key = (self.pdf_ops.preview_generation, current_page1, current_page2)
+                    pixmap = diff_pixmaps.get(diff_key)
+                    if pixmap is not None:
+                        diff_label.setPixmap(pixmap)
                         return
                     
+                    # Page images come from the previews rendered at load time
                     img1 = self.pdf_ops.get_preview(current_page1)
                     img2 = self.second_pdf_ops.get_preview(current_page2)
                     
@@ -2101,65 +2433,72 @@ class PDFMan(QMainWindow):
                     # Resize images to same size for comparison
                     size = (800, 1000)  # Standard size for comparison
                     img1 = img1.resize(size, Image.Resampling.LANCZOS)
-                    img2 = img2.resize(size, Image.Resampling.LANCZOS)
                     
-                    # Convert to RGB if needed
-                    if img1.mode != 'RGB':
-                        img1 = img1.convert('RGB')
-                    if img2.mode != 'RGB':
-                        img2 = img2.convert('RGB')
-                    
-                    # Compare images pixel by pixel
-                    diff = Image.new('RGB', size)
-                    diff_data = diff.load()
-                    img1_data = img1.load()
-                    img2_data = img2.load()
-                    
-                    for x in range(size[0]):
-                        for y in range(size[1]):
-                            r1, g1, b1 = img1_data[x, y]
-                            r2, g2, b2 = img2_data[x, y]
-                            
-                            # If pixels are different, mark in red
-                            if (r1, g1, b1) != (r2, g2, b2):
-                                diff_data[x, y] = (255, 0, 0)  # Red for differences
-                            else:
-                                diff_data[x, y] = (r1, g1, b1)
+                    # Both PDFs are rendered at the same DPI, so identical pages have identical
+                    # previews; those have nothing to mark and skip the second resize and the mask
+                    if self.pdf_ops.get_preview_digest(current_page1) == self.second_pdf_ops.get_preview_digest(current_page2):
+                        diff = np.asarray(img1 if img1.mode == 'RGB' else img1.convert('RGB'))
+                    else:
+                        img2 = img2.resize(size, Image.Resampling.LANCZOS)
+                        
+                        # Convert to RGB if needed
+                        if img1.mode != 'RGB':
+                            img1 = img1.convert('RGB')
+                        if img2.mode != 'RGB':
+                            img2 = img2.convert('RGB')
+                        
+                        # Compare images pixel by pixel, marking differences in red
+                        arr1 = np.asarray(img1)
+                        arr2 = np.asarray(img2)
+                        # OR the channel planes rather than reducing over the short colour axis
+                        channel_diff = arr1 != arr2
+                        diff_mask = channel_diff[..., 0] | channel_diff[..., 1] | channel_diff[..., 2]
+                        diff = arr1
+                        if diff_mask.any():
+                            diff = arr1.copy()
+                            np.copyto(diff, np.array((255, 0, 0), dtype=np.uint8), where=diff_mask[..., None])
                     
                     # Convert difference image to QPixmap
-                    img_data = diff.tobytes("raw", "RGB")
-                    qimg = QImage(img_data, size[0], size[1], QImage.Format.Format_RGB888)
+                    img_data = diff.tobytes()
+                    qimg = QImage(img_data, size[0], size[1], size[0] * 3, QImage.Format.Format_RGB888)
                     pixmap = QPixmap.fromImage(qimg)
+                    diff_pixmaps.put(diff_key, pixmap)
                     diff_label.setPixmap(pixmap)
                     
                 except Exception as e:
                     logger.error(f"Error updating difference view: {str(e)}")
                     logger.error(traceback.format_exc())
             
+            # Held or rapidly clicked arrows only recompute the difference once they pause
+            diff_timer = QTimer(diff_window)
+            diff_timer.setSingleShot(True)
+            diff_timer.setInterval(80)
+            diff_timer.timeout.connect(update_difference_view)
+            
             # Connect navigation buttons
             def next_page1():
                 if self.pdf_ops.current_page < self.pdf_ops.get_total_pages() - 1:
                     self.pdf_ops.current_page += 1
                     self.update_preview()  # Update main viewer
-                    update_difference_view()
+                    diff_timer.start()
             
             def prev_page1():
                 if self.pdf_ops.current_page > 0:
                     self.pdf_ops.current_page -= 1
                     self.update_preview()  # Update main viewer
-                    update_difference_view()
+                    diff_timer.start()
             
             def next_page2():
                 if self.current_page_second < self.second_pdf_ops.get_total_pages() - 1:
                     self.current_page_second += 1
                     self.update_second_pdf_viewer()  # Update second PDF viewer
-                    update_difference_view()
+                    diff_timer.start()
             
             def prev_page2():
                 if self.current_page_second > 0:
                     self.current_page_second -= 1
                     self.update_second_pdf_viewer()  # Update second PDF viewer
-                    update_difference_view()
+                    diff_timer.start()
             
             prev_page1_btn.clicked.connect(prev_page1)
             next_page1_btn.clicked.connect(next_page1)
@@ -2217,7 +2556,7 @@ class PDFMan(QMainWindow):
             self.update_preview()
             return
         try:
-            doc = fitz.open(self.pdf_ops.current_path)
+            doc = self.pdf_ops.get_search_document()
             page = doc.load_page(page_num)
             text_instances = page.search_for(term, quads=False)
             preview = self.pdf_ops.get_preview(page_num)
@@ -2243,13 +2582,13 @@ class PDFMan(QMainWindow):
         if not file_name:
             return
         try:
-            from PyPDF2 import PdfWriter
+            from pypdf import PdfWriter
             writer = PdfWriter()
             for i in sorted(self.selected_pages):
                 page = self.pdf_ops.get_page(i)
                 if page:
                     writer.add_page(page)
-            with open(file_name, 'wb') as output_file:
+            with open(file_name, 'wb', buffering=WRITE_BUFFER_SIZE) as output_file:
                 writer.write(output_file)
             QMessageBox.information(self, "Success", f"Extracted {len(self.selected_pages)} page(s) to {file_name}")
         except Exception as e:
@@ -2404,6 +2743,31 @@ class PDFMan(QMainWindow):
         self.page_spin.setValue(current_page)
         self.page_count_label.setText(f"/ {total_pages}")
 
+    def resize_image(self, image, size):
+        """Downscale an image with Lanczos, using the fastest resizer that is available"""
+        if self.resizer is not None and image.mode in ('RGB', 'RGBA', 'L'):
+            resized = Image.new(image.mode, size)
+            self.resizer.resize_pil(image, resized, self.resize_options)
+            return resized
+        if image.mode == 'RGB':
+            numba_resize = self.get_numba_resize()
+            if numba_resize is not None:
+                return numba_resize(image, size)
+        return image.resize(size, Image.Resampling.LANCZOS)
+    
+    def get_numba_resize(self):
+        """Get the Numba resampler if it is installed and can run in parallel, importing it on first use"""
+        if not self.numba_checked:
+            self.numba_checked = True
+            try:
+                # Optional; importing Numba is slow, so it stays off the startup path
+                from pdf_resize import lanczos3_resize, PARALLEL
+                if PARALLEL:
+                    self.numba_resize = lanczos3_resize
+            except ImportError:
+                pass
+        return self.numba_resize
+    
     def update_preview(self):
         """Update the PDF preview display"""
         try:
@@ -2412,42 +2776,25 @@ class PDFMan(QMainWindow):
                 self.preview_label.setText("No PDF loaded")
                 return
             
+            cache_key = (self.pdf_ops.preview_generation, self.pdf_ops.current_page)
+            # Any preview still being converted for another page is no longer wanted
+            self.pending_preview_key = cache_key
+            cached_pixmap = self.preview_pixmaps.get(cache_key)
+            if cached_pixmap is not None:
+                # Page was converted before and its preview has not changed since
+                self.preview_label.setPixmap(cached_pixmap)
+                self.preview_label.setText("")
+                return
+            
             preview = self.pdf_ops.get_current_preview()
             if preview:
-                try:
-                    # Convert PIL Image to QPixmap
-                    logger.debug(f"Converting preview image: size={preview.size}, mode={preview.mode}")
-                    
-                    # Resize the image to a more manageable size before conversion
-                    max_size = 1200  # Maximum dimension size for better quality
-                    if preview.size[0] > max_size or preview.size[1] > max_size:
-                        ratio = min(max_size / preview.size[0], max_size / preview.size[1])
-                        new_size = (int(preview.size[0] * ratio), int(preview.size[1] * ratio))
-                        preview = preview.resize(new_size, Image.Resampling.LANCZOS)
-                        logger.debug(f"Resized image to: {new_size}")
-                    
-                    # Convert to RGB if not already
-                    if preview.mode != 'RGB':
-                        preview = preview.convert('RGB')
-                    
-                    # Convert PIL Image to QPixmap directly
-                    img_data = preview.tobytes("raw", "RGB")
-                    qimg = QImage(img_data, preview.size[0], preview.size[1], preview.size[0] * 3, QImage.Format.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qimg)
-                    
-                    if pixmap.isNull():
-                        raise Exception("Failed to create QPixmap from QImage")
-                    
-                    # Set the pixmap
-                    self.preview_label.setPixmap(pixmap)
-                    self.preview_label.setText("")  # Clear any error text
-                    
-                    logger.debug("Successfully converted and displayed preview")
-                    
-                except Exception as e:
-                    logger.error(f"Error converting preview image: {str(e)}")
-                    logger.error(traceback.format_exc())
-                    self.preview_label.setText("Error displaying PDF preview")
+                # Decode lazily loaded images here; the worker only reads the pixels
+                preview.load()
+                task = PreviewRenderTask(cache_key, preview, self.resize_image)
+                task.signals.ready.connect(self.on_preview_ready)
+                # Drop queued renders for pages the user has already moved past
+                self.preview_pool.clear()
+                self.preview_pool.start(task)
             else:
                 logger.warning("No preview available")
                 self.preview_label.setText("Error: Could not generate preview")
@@ -2456,11 +2803,34 @@ class PDFMan(QMainWindow):
             logger.error(traceback.format_exc())
             self.preview_label.setText("Error updating preview")
 
+    def stop_workers(self):
+        """Drop queued preview and thumbnail conversions and wait for running ones to finish"""
+        for pool in (self.preview_pool, QThreadPool.globalInstance()):
+            pool.clear()
+            pool.waitForDone()
+    
+    def on_preview_ready(self, cache_key, qimg):
+        """Show a preview converted by a PreviewRenderTask if it is still the one wanted"""
+        current = cache_key == self.pending_preview_key and self.pdf_ops.current_pdf
+        if qimg is None:
+            if current:
+                self.preview_label.setText("Error displaying PDF preview")
+            return
+        pixmap = QPixmap.fromImage(qimg)
+        # Stale results are still valid for their own page, so keep them
+        self.preview_pixmaps.put(cache_key, pixmap)
+        if current:
+            self.preview_label.setPixmap(pixmap)
+            self.preview_label.setText("")  # Clear any error text
+            logger.debug("Successfully converted and displayed preview")
+
 def main():
     app = QApplication(sys.argv)
     window = PDFMan()
     window.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    window.stop_workers()
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -1,15 +1,17 @@
-from PyPDF2 import PdfReader, PdfWriter
 from pathlib import Path
 import os
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, convert_from_bytes
 from PIL import Image
 import io
+import tempfile
+import hashlib
+import shutil
+import time
 import logging
 import platform
 import subprocess
 import winreg
 import traceback
-from docx import Document
 
 # Set up logging
 logging.basicConfig(
@@ -18,13 +20,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# PdfWriter emits many small writes; a large buffer coalesces them into few syscalls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Edited PDFs up to this size are serialized in RAM; larger ones spill to an anonymous temp file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Rendered previews of opened files are kept here, one folder per file version and DPI
+PREVIEW_CACHE_DIR = os.path.join(Path.home(), ".cache", "pdfman")
+PREVIEW_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Unfinished render folders untouched for this long were left by a crashed or killed render
+STALE_RENDER_SECONDS = 10 * 60
+
 class PDFOperations:
     def __init__(self):
         self.current_pdf = None
         self.current_path = None
+        self.writer = None  # Editable copy of the PDF, created on the first page edit
+        self.current_stream = None  # Serialized copy of the writer, built on demand
+        self.search_doc = None  # PyMuPDF view of the current PDF, opened on demand
         self.modified = False
         self.unsaved_changes = False
         self.preview_images = []
+        self.preview_generation = 0  # Bumped whenever preview_images changes
+        self.preview_digests = {}  # Page number -> pixel hash, for preview_digest_generation
+        self.preview_digest_generation = None
         self.current_page = 0
         self.poppler_path = None
         self._init_poppler()
@@ -119,8 +139,12 @@ class PDFOperations:
         """Load a PDF file and return True if successful"""
         try:
             logger.debug(f"Loading PDF file: {file_path}")
+            # pypdf is imported on first use to keep it off the startup path
+            from pypdf import PdfReader
             self.current_pdf = PdfReader(file_path)
             self.current_path = file_path
+            self.writer = None
+            self.invalidate_reader()
             self.modified = False
             self.unsaved_changes = False
             self.current_page = 0
@@ -131,12 +155,90 @@ class PDFOperations:
             logger.error(traceback.format_exc())
             return False
     
+    def get_writer(self):
+        """Get the editable copy of the current PDF, creating it on the first edit"""
+        if self.writer is None:
+            from pypdf import PdfWriter
+            reader = self.current_pdf
+            writer = PdfWriter()
+            writer.append(reader)
+            # The writer holds its own copy of every object now, and pypdf keeps the
+            # reader alive, so free the reader's in-memory copy of the file
+            reader.stream.close()
+            self.writer = writer
+            # Pages are read from the writer from now on so edits are visible
+            self.current_pdf = writer
+        return self.writer
+    
+    def get_page_refs(self):
+        """Get the writer's list of page references"""
+        return self.get_writer().root_object["/Pages"]["/Kids"]
+    
+    def pages_changed(self):
+        """Sync the page count and view state after the page list was edited in place"""
+        from pypdf.generic import NameObject, NumberObject
+        writer = self.get_writer()
+        pages = writer.root_object["/Pages"]
+        pages[NameObject("/Count")] = NumberObject(len(pages["/Kids"]))
+        # pypdf serves writer.pages from its flattened list, so keep it in step with /Kids
+        writer.flattened_pages = [page_ref.get_object() for page_ref in pages["/Kids"]]
+        self.current_page = min(self.current_page, max(len(self.preview_images) - 1, 0))
+        self.preview_generation += 1
+        # Any serialized copy no longer matches the document
+        self.invalidate_reader()
+        self.mark_modified()
+    
+    def copy_page(self, page_ref):
+        """Add a copy of a page to the writer, sharing its content, and return its reference"""
+        from pypdf import PageObject
+        page = PageObject(self.writer)
+        page.update(page_ref.get_object())
+        # pypdf has no public way to register a new indirect object, so _add_object is used deliberately
+        return self.writer._add_object(page)
+    
+    def get_stream(self):
+        """Get the edited PDF as a file-like stream, or None if it has not been edited"""
+        if self.current_stream is None and self.writer is not None:
+            stream = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+b')
+            self.writer.write(stream)
+            self.current_stream = stream
+        if self.current_stream is not None:
+            self.current_stream.seek(0)
+        return self.current_stream
+    
+    def get_stream_bytes(self):
+        """Get the bytes of the edited PDF, or None if it has not been edited"""
+        stream = self.get_stream()
+        return stream.read() if stream is not None else None
+    
+    def get_search_document(self):
+        """Get a PyMuPDF document for the current PDF, reopening it only after edits"""
+        if self.search_doc is None:
+            import fitz  # PyMuPDF, imported on first search to keep startup fast
+            pdf_bytes = self.get_stream_bytes()
+            if pdf_bytes is not None:
+                self.search_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            elif self.current_path:
+                self.search_doc = fitz.open(self.current_path)
+        return self.search_doc
+    
+    def invalidate_reader(self):
+        """Drop views built from the current PDF so they are rebuilt on next use"""
+        if self.current_stream is not None:
+            # Closing also removes any spilled temp file
+            self.current_stream.close()
+            self.current_stream = None
+        if self.search_doc is not None:
+            self.search_doc.close()
+            self.search_doc = None
+    
     def generate_previews(self, dpi_override=None):
         """Generate preview images for all pages"""
         if not self.current_pdf:
             logger.warning("No PDF loaded, cannot generate previews")
             return
         
+        self.preview_generation += 1
         try:
             logger.debug("Generating PDF previews")
             if not self.poppler_path:
@@ -144,21 +246,104 @@ class PDFOperations:
                 return
             
             logger.debug(f"Using Poppler path: {self.poppler_path}")
-            logger.debug(f"Converting PDF: {self.current_path}")
-            
             dpi = dpi_override if dpi_override else getattr(self, 'preview_dpi', 150)
-            self.preview_images = convert_from_path(
-                self.current_path,
-                dpi=dpi,
-                fmt='jpeg',
-                poppler_path=self.poppler_path
-            )
+            pdf_bytes = self.get_stream_bytes()
+            if pdf_bytes is not None:
+                logger.debug("Converting edited PDF")
+                self.preview_images = convert_from_bytes(
+                    pdf_bytes,
+                    dpi=dpi,
+                    fmt='jpeg',
+                    poppler_path=self.poppler_path
+                )
+            else:
+                logger.debug(f"Converting PDF: {self.current_path}")
+                self.preview_images = self._get_cached_previews(dpi)
             logger.debug(f"Successfully generated {len(self.preview_images)} preview images")
         except Exception as e:
             logger.error(f"Error generating previews: {str(e)}")
             logger.error(traceback.format_exc())
             self.preview_images = []
     
+    def _get_cached_previews(self, dpi):
+        """Get the current file's previews from the disk cache, rendering and storing them on a miss"""
+        try:
+            # The file's modification time and size identify the version that was rendered
+            stat = os.stat(self.current_path)
+            key = f"{os.path.abspath(self.current_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+            cache_dir = os.path.join(PREVIEW_CACHE_DIR, f"{hashlib.sha1(key.encode()).hexdigest()}-{dpi}")
+            
+            if os.path.isdir(cache_dir):
+                paths = [os.path.join(cache_dir, name) for name in sorted(os.listdir(cache_dir))]
+                if len(paths) == len(self.current_pdf.pages):
+                    logger.debug(f"Using cached previews from {cache_dir}")
+                    os.utime(cache_dir)  # Mark as recently used
+                    return self._read_previews(paths)
+                shutil.rmtree(cache_dir)
+            
+            # Poppler writes its JPEGs straight into the cache, so storing them costs no extra encoding
+            os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+            render_dir = tempfile.mkdtemp(prefix=".render-", dir=PREVIEW_CACHE_DIR)
+            try:
+                paths = convert_from_path(
+                    self.current_path,
+                    dpi=dpi,
+                    fmt='jpeg',
+                    output_folder=render_dir,
+                    output_file="page",
+                    paths_only=True,
+                    poppler_path=self.poppler_path
+                )
+                previews = self._read_previews(paths)
+            except Exception:
+                shutil.rmtree(render_dir, ignore_errors=True)
+                raise
+            try:
+                os.replace(render_dir, cache_dir)
+            except OSError:
+                # Another window stored this file's previews first
+                shutil.rmtree(render_dir, ignore_errors=True)
+            self._prune_preview_cache()
+            return previews
+        except OSError as e:
+            logger.warning(f"Preview cache unavailable: {str(e)}")
+            return convert_from_path(
+                self.current_path,
+                dpi=dpi,
+                fmt='jpeg',
+                poppler_path=self.poppler_path
+            )
+    
+    def _read_previews(self, paths):
+        """Decode rendered pages up front; loading also closes each image's file"""
+        previews = []
+        for path in paths:
+            preview = Image.open(path)
+            preview.load()
+            previews.append(preview)
+        return previews
+    
+    def _prune_preview_cache(self):
+        """Delete the least recently used cached previews while the cache is over its size limit"""
+        entries = []
+        now = time.time()
+        for entry in os.scandir(PREVIEW_CACHE_DIR):
+            if not entry.is_dir():
+                continue
+            if entry.name.startswith(".render-"):
+                # pdftoppm keeps touching a folder it is rendering into; leave renders in progress alone
+                if now - entry.stat().st_mtime > STALE_RENDER_SECONDS:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                continue
+            size = sum(page.stat().st_size for page in os.scandir(entry.path))
+            entries.append((entry.stat().st_mtime, size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= PREVIEW_CACHE_MAX_BYTES:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+    
     def get_preview(self, page_number):
         """Get preview image for a specific page"""
         if not self.preview_images:
@@ -168,6 +353,23 @@ class PDFOperations:
         logger.warning(f"Invalid page number: {page_number}")
         return None
     
+    def get_preview_digest(self, page_number):
+        """Get a short hash of a page preview's pixels, computed once per preview generation"""
+        preview = self.get_preview(page_number)
+        if preview is None:
+            return None
+        if self.preview_digest_generation != self.preview_generation:
+            self.preview_digests = {}
+            self.preview_digest_generation = self.preview_generation
+        digest = self.preview_digests.get(page_number)
+        if digest is None:
+            # Mode and size are part of the hash so only identical images match
+            hasher = hashlib.blake2b(f"{preview.mode}{preview.size}".encode(), digest_size=8)
+            hasher.update(preview.tobytes())
+            digest = hasher.digest()
+            self.preview_digests[page_number] = digest
+        return digest
+    
     def get_current_preview(self):
         """Get preview image for current page"""
         return self.get_preview(self.current_page)
@@ -214,14 +416,20 @@ class PDFOperations:
                 return False
             
             # Create a new PDF writer
+            from pypdf import PdfWriter
             writer = PdfWriter()
             
-            # Add all pages from the current PDF
+            # Add all pages from the current PDF; copying them into a fresh
+            # writer also drops objects of pages removed while editing
             for page in self.current_pdf.pages:
                 writer.add_page(page)
             
+            # The search document may hold the target file open and indexes its old
+            # layout; drop it so it is reopened from the saved file
+            self.invalidate_reader()
+            
             # Write to file
-            with open(save_path, 'wb') as output_file:
+            with open(save_path, 'wb', buffering=WRITE_BUFFER_SIZE) as output_file:
                 writer.write(output_file)
             
             # Update current path if this was a save as operation
@@ -300,6 +508,7 @@ class PDFOperations:
                 logger.error("No PDF loaded to export")
                 return False
 
+            from docx import Document
             doc = Document()
 
             for page in self.current_pdf.pages:
@@ -322,6 +531,7 @@ class PDFOperations:
             logger.debug(f"Combining PDFs: {pdf_files} into {output_file}")
             
             # Create a new PDF writer
+            from pypdf import PdfReader, PdfWriter
             writer = PdfWriter()
             
             # Process each PDF file
@@ -334,6 +544,10 @@ class PDFOperations:
                     for page in reader.pages:
                         writer.add_page(page)
                     
+                    # The writer keeps every reader alive, but the pages are copied
+                    # now, so free this file's in-memory copy before reading the next
+                    reader.stream.close()
+                    
                     logger.debug(f"Added pages from: {pdf_file}")
                 except Exception as e:
                     logger.error(f"Error processing PDF file {pdf_file}: {str(e)}")
@@ -341,7 +555,7 @@ class PDFOperations:
                     raise
             
             # Write the combined PDF to the output file
-            with open(output_file, 'wb') as output:
+            with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as output:
                 writer.write(output)
             
             logger.info(f"Successfully combined PDFs into: {output_file}")